@@ -309,6 +309,9 @@ public:
     //! Perform named custom update
     void customUpdate(const std::string &name);
 
+    //! Reset delay queue pointers of all neuron groups to zero
+    void resetDelayPointers();
+
     //! Get current simulation timestep
     uint64_t getTimestep() const{ return m_Timestep; }
 
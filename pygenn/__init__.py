@@ -50,9 +50,19 @@ __all__ = ["create_current_source_model", "create_custom_update_model",
            "VarAccessDim", "VarAccessMode", "VarAccessModeAttribute",
            "VarLocation", "VarLocationAttribute"]
 
-if sys.version_info >= (3, 8):
-    from importlib import metadata
-else:
-    import importlib_metadata as metadata
+def __getattr__(name):
+    # Look up version from package metadata on first access rather
+    # than paying for importing and searching metadata on every import
+    if name == "__version__":
+        if sys.version_info >= (3, 8):
+            from importlib.metadata import version
+        else:
+            from importlib_metadata import version
 
-__version__ = metadata.version("pygenn")
+        globals()["__version__"] = version("pygenn")
+        return globals()["__version__"]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Module __getattr__ is only supported from Python 3.7
+if sys.version_info < (3, 7):
+    __version__ = __getattr__("__version__")
@@ -49,7 +49,7 @@ def _get_synapse_var_shape(var_dims, sg, batch_size):
     else:
         return num_copies + (1,)
 
-class GroupMixin(object):
+class GroupMixin:
     """This is the base class for the mixins added to all types of groups.
     It provides basic functionality for handling variables, 
     extra global parameters and dynamic parameters
@@ -68,6 +68,10 @@ class GroupMixin(object):
         Args:
             model:  model this group is part of
         """
+        # **NOTE** a weakref.proxy is used so groups don't keep the model
+        # alive. This avoids a reference cycle which would keep the runtime,
+        # its device memory and the loaded runner library alive until the
+        # cyclic garbage collector happens to run if the model is dropped
         self._model = proxy(model)
         self.vars = {}
         self.extra_global_params = {}
@@ -178,6 +182,9 @@ class GroupMixin(object):
             egp_dict = self.extra_global_params
 
         # Loop through extra global params
+        # **NOTE** rather than pushing each EGP individually, the runtime
+        # arrays are returned so the caller can push them all at once
+        arrays = []
         for egp_name, egp_data in egp_dict.items():
             if egp_data.init_values is not None:
                 # Allocate memory
@@ -191,8 +198,10 @@ class GroupMixin(object):
                 # Copy values
                 egp_data.values = egp_data.init_values
 
-                # Push egp_data
-                egp_data.push_to_device()
+                # Add to list of arrays to push
+                arrays.append(egp_data._array)
+
+        return arrays
 
     def _load_var_init_egps(self, var_dict=None):
         # If no variable dictionary is specified, use standard one
@@ -200,8 +209,25 @@ class GroupMixin(object):
             var_dict = self.vars
 
         # Loop through variables and load any associated initialisation egps
+        arrays = []
         for var_name, var_data in var_dict.items():
-            self._load_egp(var_data.extra_global_params, var_name)
+            arrays += self._load_egp(var_data.extra_global_params, var_name)
+
+        return arrays
+
+    def _reinitialise_vars(self, var_dict=None):
+        # If no variable dictionary is specified, use standard one
+        if var_dict is None:
+            var_dict = self.vars
+
+        # Loop through variables and copy init_values back 
+        # into any which are loaded and require manual initialisation
+        for v in var_dict.values():
+            if v.init_required and v._view is not None:
+                v.values = v.init_values
+
+    def _reinitialise(self):
+        self._reinitialise_vars()
 
     def _unload_vars(self, var_dict=None):
         # If no variable dictionary is specified, use standard one
@@ -298,7 +324,7 @@ class NeuronGroupMixin(GroupMixin):
                        else None))
 
         # Load neuron extra global params
-        self._load_egp()
+        return self._load_egp()
 
     def _unload(self):
         self._unload_vars()
@@ -309,7 +335,7 @@ class NeuronGroupMixin(GroupMixin):
 
     def _load_init_egps(self):
         # Load any egps used for variable initialisation
-        self._load_var_init_egps()
+        return self._load_var_init_egps()
 
 class SynapseGroupMixin(GroupMixin):
     """Mixin added to synapse group objects
@@ -552,21 +578,9 @@ class SynapseGroupMixin(GroupMixin):
                     self._row_lengths = self._get_array("rowLength",
                                                         types.Uint32)
 
-                    # If data is available
+                    # If data is available, copy it in
                     if self.connections_set:
-                        # Copy in row length
-                        self._row_lengths.view[:] = self.row_lengths
-
-                        # Create (x)range containing the index where each row starts in ind
-                        row_start_idx = range(0, self.weight_update_var_size,
-                                              self.max_connections)
-
-                        # Loop through ragged matrix rows
-                        syn = 0
-                        for i, r in zip(row_start_idx, self.row_lengths):
-                            # Copy row from non-padded indices into correct location
-                            self._ind.view[i:i + r] = self.ind[syn:syn + r]
-                            syn += r
+                        self._copy_sparse_connections()
                     elif not self._connectivity_initialiser_provided:
                         raise Exception("For sparse projections, the connections"
                                         "must be set before loading a model")
@@ -636,22 +650,49 @@ class SynapseGroupMixin(GroupMixin):
                     (self._model.batch_size, self.trg.num_neurons))
 
         # Load extra global parameters
-        self._load_egp()
-        self._load_egp(self.psm_extra_global_params)
+        return (self._load_egp()
+                + self._load_egp(self.psm_extra_global_params))
 
     def _load_init_egps(self):
         # Load any egps used for connectivity initialisation
-        self._load_egp(self.connectivity_extra_global_params)
+        arrays = self._load_egp(self.connectivity_extra_global_params)
 
         # Load any egps used for variable initialisation
-        self._load_var_init_egps()
+        arrays += self._load_var_init_egps()
 
         # Load any egps used for postsynaptic model variable initialisation
-        self._load_var_init_egps(self.psm_vars)
+        arrays += self._load_var_init_egps(self.psm_vars)
 
         # Load any egps used for pre and postsynaptic variable initialisation
-        self._load_var_init_egps(self.pre_vars)
-        self._load_var_init_egps(self.post_vars)
+        arrays += self._load_var_init_egps(self.pre_vars)
+        arrays += self._load_var_init_egps(self.post_vars)
+        return arrays
+
+    def _reinitialise(self):
+        # If connectivity was set manually and is located on host,
+        # copy it back in so it gets pushed to device again
+        if self.connections_set and self._row_lengths is not None:
+            self._copy_sparse_connections()
+
+        self._reinitialise_vars()
+        self._reinitialise_vars(self.pre_vars)
+        self._reinitialise_vars(self.post_vars)
+        self._reinitialise_vars(self.psm_vars)
+
+    def _copy_sparse_connections(self):
+        # Copy in row length
+        self._row_lengths.view[:] = self.row_lengths
+
+        # Create (x)range containing the index where each row starts in ind
+        row_start_idx = range(0, self.weight_update_var_size,
+                              self.max_connections)
+
+        # Loop through ragged matrix rows
+        syn = 0
+        for i, r in zip(row_start_idx, self.row_lengths):
+            # Copy row from non-padded indices into correct location
+            self._ind.view[i:i + r] = self.ind[syn:syn + r]
+            syn += r
 
     @property
     def _connectivity_initialiser_provided(self):
@@ -707,11 +748,11 @@ class CurrentSourceMixin(GroupMixin):
                             self._model.batch_size))
 
         # Load current source extra global parameters
-        self._load_egp()
+        return self._load_egp()
 
     def _load_init_egps(self):
         # Load any egps used for variable initialisation
-        self._load_var_init_egps()
+        return self._load_var_init_egps()
 
     def _unload(self):
         self._unload_vars()
@@ -745,11 +786,11 @@ class CustomUpdateMixin(GroupMixin):
                         lambda v, d: _get_neuron_var_shape(
                             get_var_access_dim(v.access, self._dims),
                             self.num_neurons, batch_size))
-        self._load_egp()
+        return self._load_egp()
  
     def _load_init_egps(self):
         # Load any egps used for variable initialisation
-        self._load_var_init_egps()
+        return self._load_var_init_egps()
 
     def _unload(self):
         self._unload_vars()
@@ -792,7 +833,7 @@ class CustomUpdateWUMixin(GroupMixin):
             self.vars, self.get_var_location)
 
         # Load custom update extra global parameters
-        self._load_egp()
+        return self._load_egp()
     
     @deprecated("Please access values directly on variable")
     def get_var_values(self, var_name):
@@ -800,7 +841,7 @@ class CustomUpdateWUMixin(GroupMixin):
 
     def _load_init_egps(self):
         # Load any egps used for variable initialisation
-        self._load_var_init_egps()
+        return self._load_var_init_egps()
 
     def _unload(self):
         self._unload_vars()
@@ -865,15 +906,21 @@ class CustomConnectivityUpdateMixin(GroupMixin):
             self.post_vars, self.get_post_var_location)
 
         # Load custom update extra global parameters
-        self._load_egp()
+        return self._load_egp()
 
     def _load_init_egps(self):
         # Load any egps used for variable initialisation
-        self._load_var_init_egps()
+        arrays = self._load_var_init_egps()
         
         # Load any egps used for pre and postsynaptic variable initialisation
-        self._load_var_init_egps(self.pre_vars)
-        self._load_var_init_egps(self.post_vars)
+        arrays += self._load_var_init_egps(self.pre_vars)
+        arrays += self._load_var_init_egps(self.post_vars)
+        return arrays
+
+    def _reinitialise(self):
+        self._reinitialise_vars()
+        self._reinitialise_vars(self.pre_vars)
+        self._reinitialise_vars(self.post_vars)
 
     def _unload(self):
         self._unload_vars()
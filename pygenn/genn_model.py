@@ -7,8 +7,8 @@ from . import (current_source_models, custom_connectivity_update_models,
                neuron_models, postsynaptic_models, types, weight_update_models)
 
 
-from collections import OrderedDict
-from typing import Callable, Dict, Optional, List, Sequence, Tuple, Union
+from typing import (Callable, Dict, Iterable, Optional, List, Sequence,
+                    Tuple, Union)
 from ._genn import (CurrentSource, CurrentSourceModelBase,
                     CustomConnectivityUpdate, CustomConnectivityUpdateModelBase,
                     CustomUpdate, CustomUpdateModelBase, CustomUpdateVar,
@@ -22,23 +22,30 @@ from ._genn import (CurrentSource, CurrentSourceModelBase,
                     ToeplitzConnectivityInit, UnresolvedType, Var, VarAccess,
                     VarAccessMode, VarInit, VarLocation, VarRef, VarReference,
                     WeightUpdateInit, WeightUpdateModelBase, WUVarReference)
-from ._runtime import Runtime
+from ._runtime import (Runtime, pull_arrays_from_device,
+                       push_arrays_to_device)
 from .genn_groups import (CurrentSourceMixin, CustomConnectivityUpdateMixin,
                           CustomUpdateMixin, CustomUpdateWUMixin,
                           NeuronGroupMixin, SynapseGroupMixin)
 
+from collections.abc import Mapping
+from functools import lru_cache, wraps
 from importlib import import_module
-from os import path, environ
+from importlib.util import find_spec
+from itertools import chain
+from os import path, environ, scandir, stat
 from platform import system
 from psutil import cpu_count
 from shutil import which
 from subprocess import check_call  # to call make
 from textwrap import dedent
+from types import MappingProxyType
 from warnings import warn
-from weakref import proxy
+from weakref import WeakValueDictionary
 from ._genn import generate_code, init_logging
 from ._deprecated import deprecated
-from .model_preprocessor import _get_snippet, _get_var_init, _prepare_param_vals
+from .model_preprocessor import (ArrayBase, _get_snippet, _get_var_init,
+                                 _prepare_param_vals)
 
 # Type aliases used in model creation functions
 TypeType = Union[str, ResolvedType]
@@ -53,7 +60,7 @@ ModelVarRefsType = Optional[Sequence[Union[Tuple[str, TypeType],
 ModelEGPType = Optional[Sequence[Tuple[str, TypeType]]]
 
 # Type aliases used in add_XXX methods
-PopParamVals = Dict[str, Union[int, float]]
+PopParamVals = Union[Dict[str, Union[int, float]], np.ndarray]
 PopVarVals = Dict[str, Union[VarInit, int, float, np.ndarray, Sequence]]
 PopVarRefs = Dict[str, VarReference] 
 PopWUVarRefs = Dict[str, WUVarReference]
@@ -99,21 +106,65 @@ if system() == "Windows":
         add_dll_directory(path.join(environ["CUDA_PATH"], "bin"))
 
 
-# Loop through backends in preferential order
-backend_modules = OrderedDict()
-for b in ["cuda", "hip", "single_threaded_cpu"]:
-    # Try and import
-    try:
-        m = import_module("." + b + "_backend", "pygenn")
-    # Ignore failed imports - likely due to non-supported backends
-    except ImportError as ex:
-        pass
-    # Raise any other errors
-    except:
-        raise
-    # Otherwise add to (ordered) dictionary
-    else:
-        backend_modules[b] = m
+# Read-only dictionary of backend module paths in preferential order
+_backend_module_paths = MappingProxyType({
+    "cuda":                 "pygenn.cuda_backend",
+    "hip":                  "pygenn.hip_backend",
+    "single_threaded_cpu":  "pygenn.single_threaded_cpu_backend"})
+
+# Find ccache (if installed) to use when compiling generated code
+_ccache = None if system() == "Windows" else which("ccache")
+
+class _BackendModules(Mapping):
+    """Read-only mapping of available backend names to backend modules.
+    Backends are probed without executing them and only imported when first
+    accessed so e.g. the CUDA runtime isn't loaded unless it's used. As a
+    result, accessing a backend which is installed but can't be loaded on
+    this machine raises ImportError rather than KeyError.
+    """
+    def __init__(self):
+        self._modules = {}
+        self._available = tuple(
+            b for b, p in _backend_module_paths.items()
+            if find_spec(p) is not None)
+
+    def __getitem__(self, backend_name):
+        if backend_name not in self._available:
+            raise KeyError(backend_name)
+
+        # Import backend module if it hasn't already been
+        if backend_name not in self._modules:
+            self._modules[backend_name] = import_module(
+                _backend_module_paths[backend_name])
+        return self._modules[backend_name]
+
+    def __contains__(self, backend_name):
+        # **NOTE** Mapping.__contains__ would go through 
+        # __getitem__ and thus import the backend
+        return backend_name in self._available
+
+    def __iter__(self):
+        return iter(self._available)
+
+    def __len__(self):
+        return len(self._available)
+
+backend_modules = _BackendModules()
+
+# Read-only dictionary containing conversions 
+# between GeNN C++ types and numpy types
+_genn_types = MappingProxyType({
+    types.Float:    np.float32,
+    types.Double:   np.float64,
+    types.Int64:    np.int64,
+    types.Uint64:   np.uint64,
+    types.Int32:    np.int32,
+    types.Uint32:   np.uint32,
+    types.Int16:    np.int16,
+    types.Uint16:   np.uint16,
+    types.Int8:     np.int8,
+    types.Uint8:    np.uint8,
+    types.Bool:     np.bool_})
 
 # Regular expressions used for upgrading function calls and variables in code strings
 _code_upgrades = [
@@ -149,9 +200,66 @@ def _wrap_max_length_lambda(f):
 def _wrap_kernel_size_lambda(f):
     return lambda pars: f({n: p.value for n, p in pars.items()})
 
+# Models created by create_XXX functions, indexed by their arguments
+# **NOTE** groups keep their own references to models so
+# models no longer in use can be dropped from the cache
+_model_cache = WeakValueDictionary()
+
 # Regular expression used for upgrading remaining variable references in code strings
 _var_upgrade = re.compile(r"\$\(([_a-zA-Z][_a-zA-Z0-9]*)\)")
 
+def _is_runner_up_to_date(output_path):
+    """Check whether the runner library in output_path is 
+    newer than the Makefile and all generated source files"""
+    # If library doesn't exist, it needs building
+    try:
+        lib_mtime = stat(path.join(output_path, "librunner.so")).st_mtime
+    except FileNotFoundError:
+        return False
+
+    # Otherwise, check no generated file has been modified since
+    with scandir(output_path) as it:
+        return all(e.stat().st_mtime <= lib_mtime for e in it
+                   if e.is_file() and (e.name == "Makefile"
+                                       or e.name.endswith((".cc", ".h"))))
+
+@lru_cache(maxsize=None)
+def _get_preference_names(backend_module):
+    """Get set of the public attribute names of a backend's preferences"""
+    return frozenset(k for k in dir(backend_module.Preferences())
+                     if not k.startswith("_"))
+
+def _get_host_arrays(arrays):
+    # Get runtime arrays, checking that all have been allocated
+    # on host rather than passing null pointers through to C++
+    host_arrays = [a._array for a in arrays]
+    if any(a is None for a in host_arrays):
+        raise ValueError("Only arrays which are located on the host and "
+                         "have been allocated can be transferred")
+    return host_arrays
+
+def _forbid_built(method):
+    """Decorator for :class:`.GeNNModel` methods 
+    which can only be called before model is built"""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self._built:
+            raise Exception("GeNN model already built")
+        return method(self, *args, **kwargs)
+    return wrapper
+
+def _require_loaded(action):
+    """Decorator for :class:`.GeNNModel` methods 
+    which can only be called once model is loaded"""
+    def decorator(method):
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if not self._loaded:
+                raise Exception(f"GeNN model has to be loaded {action}")
+            return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
 class GeNNModel(ModelSpec):
     """This class provides an interface for 
     defining, building and running models
@@ -172,6 +280,14 @@ class GeNNModel(ModelSpec):
         preference_kwargs:      Additional keyword arguments to set in backend preferences structure
     """
 
+    # **NOTE** ModelSpec already provides weak reference support
+    __slots__ = ("_backend", "_backend_module", "_backend_name", "_built",
+                 "_groups", "_loaded", "_model_merged", "_path_to_model",
+                 "_preference_kwargs", "_preferences", "_runtime",
+                 "backend_log_level", "current_sources",
+                 "custom_connectivity_updates", "custom_updates",
+                 "genn_types", "neuron_populations", "synapse_populations")
+
     def __init__(self, precision: TypeType = "float",
                  model_name: str = "GeNNModel",
                  backend: Optional[str] = None, 
@@ -218,21 +334,11 @@ class GeNNModel(ModelSpec):
         self.current_sources = {}
         self.custom_connectivity_updates = {}
         self.custom_updates = {}
+        self._groups = ()
 
-        # Build dictionary containing conversions 
+        # Share read-only dictionary containing conversions
         # between GeNN C++ types and numpy types
-        self.genn_types = {
-            types.Float:    np.float32,
-            types.Double:   np.float64,
-            types.Int64:    np.int64,
-            types.Uint64:   np.uint64,
-            types.Int32:    np.int32,
-            types.Uint32:   np.uint32,
-            types.Int16:    np.int16,
-            types.Uint16:   np.uint16,
-            types.Int8:     np.int8,
-            types.Uint8:    np.uint8,
-            types.Bool:     np.bool_}
+        self.genn_types = _genn_types
 
     @property
     def backend_name(self) -> str:
@@ -246,12 +352,20 @@ class GeNNModel(ModelSpec):
 
         # If no backend is specified
         if backend_name is None:
-            # Check we have managed to import any bagenn_wrapperckends
-            assert len(backend_modules) > 0
-
-            # Set name to first (i.e. best) backend and lookup module from dictionary
-            self._backend_name = next(iter(backend_modules))
-            self._backend_module = backend_modules[self._backend_name]
+            # Loop through available backends in preferential order
+            for b in backend_modules:
+                # Try and import
+                try:
+                    self._backend_module = backend_modules[b]
+                # Ignore failed imports - likely due to non-supported backends
+                except ImportError:
+                    pass
+                # Otherwise, use this backend
+                else:
+                    self._backend_name = b
+                    break
+            else:
+                raise Exception("No GeNN backends could be imported")
         else:
             self._backend_name = backend_name
             self._backend_module = backend_modules[backend_name]
@@ -348,6 +462,7 @@ class GeNNModel(ModelSpec):
         """
         return self._runtime.get_custom_update_remap_time(name)
 
+    @_forbid_built
     def add_neuron_population(self, pop_name: str, num_neurons: int, 
                               neuron: Union[NeuronModelBase, str],
                               params: PopParamVals = {}, 
@@ -373,8 +488,6 @@ class GeNNModel(ModelSpec):
                                               {"a": 0.02, "b": 0.2, "c": -65.0, "d": 6.0},
                                               {"V": -65.0, "U": -20.0})
         """
-        if self._built:
-            raise Exception("GeNN model already built")
 
         # Resolve neuron model
         neuron = _get_snippet(neuron, NeuronModelBase, neuron_models)
@@ -385,7 +498,7 @@ class GeNNModel(ModelSpec):
         # Use superclass to add population
         n_group = self._add_neuron_population(pop_name,
                                               int(num_neurons), neuron,
-                                              _prepare_param_vals(params),
+                                              _prepare_param_vals(params, neuron),
                                               var_init)
         
         # Initialise group, store group in dictionary and return
@@ -393,6 +506,7 @@ class GeNNModel(ModelSpec):
         self.neuron_populations[pop_name] = n_group
         return n_group
 
+    @_forbid_built
     def add_synapse_population(self, pop_name: str, matrix_type: Union[SynapseMatrixType, str],
                                source: NeuronGroup, target: NeuronGroup, 
                                weight_update_init, postsynaptic_init, 
@@ -430,8 +544,6 @@ class GeNNModel(ModelSpec):
                                                init_postsynaptic("ExpCurr", {"tau": 5.0}),
                                                init_sparse_connectivity("FixedProbability", {"prob": 0.1}))
         """
-        if self._built:
-            raise Exception("GeNN model already built")
 
         # If matrix type is a string, loop up enumeration value
         if isinstance(matrix_type, str):
@@ -457,6 +569,7 @@ class GeNNModel(ModelSpec):
         self.synapse_populations[pop_name] = s_group
         return s_group
 
+    @_forbid_built
     def add_current_source(self, cs_name: str, current_source_model: Union[CurrentSourceModelBase, str], 
                            pop: NeuronGroup, params: PopParamVals = {}, vars: PopVarVals = {}, 
                            var_refs: PopVarRefs = {}) -> CurrentSource:
@@ -485,8 +598,6 @@ class GeNNModel(ModelSpec):
         where ``pop`` is a reference to a neuron population 
         (as returned by :meth:`.GeNNModel.add_neuron_population`)
         """
-        if self._built:
-            raise Exception("GeNN model already built")
 
         # Resolve current source model
         current_source_model = _get_snippet(current_source_model, CurrentSourceModelBase,
@@ -498,7 +609,8 @@ class GeNNModel(ModelSpec):
         # Use superclass to add population
         c_source = self._add_current_source(cs_name,
                                             current_source_model, pop,
-                                            _prepare_param_vals(params),
+                                            _prepare_param_vals(
+                                                params, current_source_model),
                                             var_init, var_refs)
         
         # Initialise group, store group in dictionary and return
@@ -506,6 +618,7 @@ class GeNNModel(ModelSpec):
         self.current_sources[cs_name] = c_source
         return c_source
     
+    @_forbid_built
     def add_custom_update(self, cu_name: str, group_name: str, 
                           custom_update_model: Union[CustomUpdateModelBase, str],
                           params: PopParamVals = {}, vars: PopVarVals = {}, 
@@ -549,9 +662,6 @@ class GeNNModel(ModelSpec):
             model.custom_update("transpose")
 
         """
-        if self._built:
-            raise Exception("GeNN model already built")
-        
         # Resolve custom update model
         custom_update_model = _get_snippet(custom_update_model, CustomUpdateModelBase,
                                            custom_update_models)
@@ -562,7 +672,8 @@ class GeNNModel(ModelSpec):
         # Use superclass to add population
         c_update = self._add_custom_update(cu_name, group_name,
                                            custom_update_model,
-                                           _prepare_param_vals(params),
+                                           _prepare_param_vals(
+                                               params, custom_update_model),
                                            var_init, var_refs, egp_refs)
 
         # Setup back-reference, store group in dictionary and return
@@ -570,6 +681,7 @@ class GeNNModel(ModelSpec):
         self.custom_updates[cu_name] = c_update
         return c_update
     
+    @_forbid_built
     def add_custom_connectivity_update(self, cu_name: str, group_name: str, 
                                        syn_group: SynapseGroup,
                                        custom_conn_update_model: Union[CustomConnectivityUpdateModelBase, str],
@@ -609,8 +721,6 @@ class GeNNModel(ModelSpec):
                                         :func:`.create_egp_ref` (see :ref:`section-extra-global-parameter-references`).
 
         """
-        if self._built:
-            raise Exception("GeNN model already built")
 
         # Resolve custom update model
         custom_connectivity_update_model = _get_snippet(
@@ -625,7 +735,8 @@ class GeNNModel(ModelSpec):
         # Use superclass to add population
         c_update = self._add_custom_connectivity_update(
             cu_name, group_name, syn_group, custom_connectivity_update_model,
-            _prepare_param_vals(params), var_init, pre_var_init, post_var_init,
+            _prepare_param_vals(params, custom_connectivity_update_model),
+            var_init, pre_var_init, post_var_init,
             var_refs, pre_var_refs, post_var_refs, egp_refs)
 
         # Setup back-reference, store group in dictionary and return
@@ -633,6 +744,7 @@ class GeNNModel(ModelSpec):
         self.custom_connectivity_updates[cu_name] = c_update
         return c_update
         
+    @_forbid_built
     def build(self, path_to_model: str = "./", always_rebuild: bool = False, 
               never_rebuild: bool = False):
         """Finalize and build a GeNN model
@@ -646,9 +758,6 @@ class GeNNModel(ModelSpec):
                             need it. This should only ever be used to prevent
                             file overwriting when performing parallel runs
         """
-
-        if self._built:
-            raise Exception("GeNN model already built")
         self._path_to_model = path_to_model
 
         # Create output path
@@ -658,12 +767,21 @@ class GeNNModel(ModelSpec):
         # Finalize model
         self._finalise()
 
+        # Now no more groups can be added, build flat tuple of all
+        # groups in the order they should be loaded to iterate over
+        self._groups = tuple(chain(self.neuron_populations.values(),
+                                   self.synapse_populations.values(),
+                                   self.current_sources.values(),
+                                   self.custom_connectivity_updates.values(),
+                                   self.custom_updates.values()))
+
         # Create suitable preferences object for backend
         self._preferences = self._backend_module.Preferences()
 
         # Set attributes on preferences object from kwargs
+        preference_names = _get_preference_names(self._backend_module)
         for k, v in self._preference_kwargs.items():
-            if hasattr(self._preferences, k):
+            if k in preference_names:
                 setattr(self._preferences, k, v)
             else:
                 raise ValueError(f"Unknown preference '{k}'")
@@ -681,8 +799,20 @@ class GeNNModel(ModelSpec):
             if system() == "Windows":
                 check_call([_msbuild, "/p:Configuration=Release", "/m", "/verbosity:quiet",
                             path.join(output_path, "runner.vcxproj")])
-            else:
-                check_call(["make", "-j", str(cpu_count(logical=False)), "-C", output_path])
+            elif always_rebuild or not _is_runner_up_to_date(output_path):
+                # If ccache is available and not already being used,
+                # use it to compile generated code so rebuilds are faster
+                # **NOTE** g++ is make's default C++ compiler
+                make_env = None
+                cxx = environ.get("CXX", "g++")
+                if _ccache is not None and "ccache" not in cxx:
+                    make_env = dict(environ, CXX=f"{_ccache} {cxx}")
+
+                # Build using all logical cores as compilation
+                # is largely front-end rather than FPU bound
+                num_jobs = cpu_count(logical=True) or 1
+                check_call(["make", "-j", str(num_jobs), "-C", output_path],
+                           env=make_env)
 
         self._built = True
 
@@ -711,50 +841,26 @@ class GeNNModel(ModelSpec):
         # Allocate memory
         self._runtime.allocate(num_recording_timesteps)
 
-        # Loop through neuron populations and load any
-        # extra global parameters required for initialization
-        for pop_data in self.neuron_populations.values():
-            pop_data._load_init_egps()
-
-        # Loop through synapse populations and load any 
-        # extra global parameters required for initialization
-        for pop_data in self.synapse_populations.values():
-            pop_data._load_init_egps()
-
-        # Loop through current sources
-        for src_data in self.current_sources.values():
-            src_data._load_init_egps()
+        # Loop through all groups and allocate any extra
+        # global parameters required for initialization
+        init_egp_arrays = []
+        for g in self._groups:
+            init_egp_arrays += g._load_init_egps()
 
-        # Loop through custom connectivity updates
-        for cu_data in self.custom_connectivity_updates.values():
-            cu_data._load_init_egps()
-
-        # Loop through custom updates
-        for cu_data in self.custom_updates.values():
-            cu_data._load_init_egps()
+        # Push them all to device in one go
+        push_arrays_to_device(init_egp_arrays)
 
         # Initialize model
         self._runtime.initialize()
 
-        # Loop through neuron populations
-        for pop_data in self.neuron_populations.values():
-            pop_data._load()
-
-        # Loop through synapse populations
-        for pop_data in self.synapse_populations.values():
-            pop_data._load()
-
-        # Loop through current sources
-        for src_data in self.current_sources.values():
-            src_data._load()
+        # Loop through all groups and load them,
+        # allocating any extra global parameters
+        egp_arrays = []
+        for g in self._groups:
+            egp_arrays += g._load()
 
-        # Loop through custom connectivity updates
-        for cu_data in self.custom_connectivity_updates.values():
-            cu_data._load()
-
-        # Loop through custom updates
-        for cu_data in self.custom_updates.values():
-            cu_data._load()
+        # Push all extra global parameters to device in one go
+        push_arrays_to_device(egp_arrays)
 
         # Now everything is set up call the sparse initialisation function
         self._runtime.initialize_sparse()
@@ -764,30 +870,44 @@ class GeNNModel(ModelSpec):
         self._built = True
 
 
-    def unload(self):
-        """Unload a previously loaded model, freeing all memory"""
-        if not self._loaded:
-            raise Exception("GeNN model has not been built")
-            
-        # Loop through custom updates and unload
-        for cu_data in self.custom_updates.values():
-            cu_data._unload()
-        
-        # Loop through custom connectivity updates and unload
-        for cu_data in self.custom_connectivity_updates.values():
-            cu_data._unload()
-    
-        # Loop through current sources and unload
-        for src_data in self.current_sources.values():
-            src_data._unload()
+    @_require_loaded("before reinitialising")
+    def reinitialise(self):
+        """Reinitialise a previously loaded model and reset the timestep
+        to zero without reloading it. Variables are re-initialised using
+        the same initialisers or values they were originally loaded with
+        and sparse connectivity set with 
+        :meth:`.SynapseGroupMixin.set_sparse_connections` is restored.
+
+        .. note::
+            This re-runs the model's initialisation code, so sparse 
+            connectivity and variables which are initialised on device
+            are regenerated rather than restored. In particular, those 
+            using random initialisers (such as ``FixedProbability`` or 
+            ``Uniform``) will be redrawn and will generally differ from 
+            the values drawn when the model was loaded.
+        """
+        # Initialise device state
+        self._runtime.initialize()
 
-        # Loop through synapse populations and unload
-        for pop_data in self.synapse_populations.values():
-            pop_data._unload()
+        # Loop through all groups and copy values back into 
+        # any variables which are initialised manually from host
+        for g in self._groups:
+            g._reinitialise()
 
-        # Loop through neuron populations and unload
-        for pop_data in self.neuron_populations.values():
-            pop_data._unload()
+        # Push these and initialise any sparse variables
+        self._runtime.initialize_sparse()
+
+        # Reset time and host copies of delay queue pointers
+        self._runtime.timestep = 0
+        self._runtime.reset_delay_pointers()
+
+    @_require_loaded("before unloading")
+    def unload(self):
+        """Unload a previously loaded model, freeing all memory"""
+        # Loop through all groups in reverse order of loading and 
+        # unload, clearing views onto variables and extra global parameters
+        for g in reversed(self._groups):
+            g._unload()
 
         # Close runtime
         self._runtime = None
@@ -797,11 +917,50 @@ class GeNNModel(ModelSpec):
 
     def step_time(self):
         """Make one simulation step"""
+        # **NOTE** check is performed inline rather than with
+        # _require_loaded to avoid an extra call every timestep
         if not self._loaded:
             raise Exception("GeNN model has to be loaded before stepping")
 
         self._runtime.step_time()
     
+    @_require_loaded("before stepping")
+    def run(self, num_steps: int,
+            record: Optional[Dict[ArrayBase, np.ndarray]] = None):
+        """Make several simulation steps without returning to Python 
+        between them, optionally recording arrays after each step.
+
+        Args:
+            num_steps:  number of simulation steps to make
+            record:     dictionary mapping arrays (typically variables)
+                        to pre-allocated, C-contiguous destination arrays
+                        with the same dtype. After each step, each array is 
+                        pulled from the device and its entire contents 
+                        copied into the next row of its destination
+
+        For example, the membrane voltage of a population could be recorded
+        for 1000 timesteps with:
+
+        ..  code-block:: python
+
+            v = np.empty((1000,) + pop.vars["V"].view.shape, 
+                         dtype=pop.vars["V"].view.dtype)
+            model.run(1000, {pop.vars["V"]: v})
+        """
+        arrays = []
+        destinations = []
+        if record is not None:
+            arrays = _get_host_arrays(record.keys())
+            for a, d in record.items():
+                if not isinstance(d, np.ndarray) or d.dtype != a._view.dtype:
+                    raise ValueError("Recording destinations must be numpy "
+                                     "arrays with the same dtype as the "
+                                     "array being recorded")
+                destinations.append(d)
+
+        self._runtime.run(num_steps, arrays, destinations)
+
+    @_require_loaded("before performing custom update")
     def custom_update(self, name: str):
         """Perform custom update
 
@@ -810,23 +969,42 @@ class GeNNModel(ModelSpec):
                     parameter passed to :meth:`.add_custom_update` and
                     :meth:`.add_custom_connectivity_update`.
         """
-        if not self._loaded:
-            raise Exception("GeNN model has to be loaded before performing custom update")
-            
         self._runtime.custom_update(name)
    
 
+    @_require_loaded("before pulling recording buffers")
     def pull_recording_buffers_from_device(self):
         """Pull recording buffers from device"""
-        if not self._loaded:
-            raise Exception("GeNN model has to be loaded before pulling recording buffers")
-
         if not self._recording_in_use:
             raise Exception("Cannot pull recording buffer if recording system is not in use")
 
         # Pull recording buffers from device
         self._runtime.pull_recording_buffers_from_device()
 
+    @_require_loaded("before pushing")
+    def push_to_device(self, arrays: Iterable[ArrayBase]):
+        """Copy several arrays from host to device in a single call.
+        This is equivalent to calling :meth:`.ArrayBase.push_to_device`
+        on each array but only crosses from Python into C++ once.
+
+        Args:
+            arrays: variables, extra global parameters or 
+                    other arrays to push
+        """
+        push_arrays_to_device(_get_host_arrays(arrays))
+
+    @_require_loaded("before pulling")
+    def pull_from_device(self, arrays: Iterable[ArrayBase]):
+        """Copy several arrays from device to host in a single call.
+        This is equivalent to calling :meth:`.ArrayBase.pull_from_device`
+        on each array but only crosses from Python into C++ once.
+
+        Args:
+            arrays: variables, extra global parameters or 
+                    other arrays to pull
+        """
+        pull_arrays_from_device(_get_host_arrays(arrays))
+
 def init_var(snippet: Union[InitVarSnippetBase, str],
              params: PopParamVals = {}):
     """Initialises a variable initialisation snippet with parameter values
@@ -849,7 +1027,7 @@ def init_var(snippet: Union[InitVarSnippetBase, str],
     snippet = _get_snippet(snippet, InitVarSnippetBase, init_var_snippets)
 
     # Use add function to create suitable VarInit
-    return VarInit(snippet, _prepare_param_vals(params))
+    return VarInit(snippet, _prepare_param_vals(params, snippet))
 
 def init_sparse_connectivity(snippet: Union[InitSparseConnectivitySnippetBase, str],
                              params: PopParamVals = {}):
@@ -872,7 +1050,8 @@ def init_sparse_connectivity(snippet: Union[InitSparseConnectivitySnippetBase, s
     # Get snippet and wrap in SparseConnectivityInit object
     snippet = _get_snippet(snippet, InitSparseConnectivitySnippetBase,
                            init_sparse_connectivity_snippets)
-    return SparseConnectivityInit(snippet, _prepare_param_vals(params))
+    return SparseConnectivityInit(snippet,
+                                  _prepare_param_vals(params, snippet))
 
 
 def init_postsynaptic(snippet: Union[PostsynapticModelBase, str], 
@@ -911,7 +1090,7 @@ def init_postsynaptic(snippet: Union[PostsynapticModelBase, str],
     # Extract parts of var spaces which should be initialised by GeNN
     var_init = _get_var_init(vars)
     
-    return (PostsynapticInit(snippet, _prepare_param_vals(params), 
+    return (PostsynapticInit(snippet, _prepare_param_vals(params, snippet), 
                              var_init, var_refs), 
             vars)
 
@@ -955,8 +1134,8 @@ def init_weight_update(snippet, params: PopParamVals = {}, vars: PopVarVals = {}
     pre_var_init = _get_var_init(pre_vars)
     post_var_init = _get_var_init(post_vars)
     
-    return (WeightUpdateInit(snippet, _prepare_param_vals(params), var_init, 
-                             pre_var_init, post_var_init,
+    return (WeightUpdateInit(snippet, _prepare_param_vals(params, snippet),
+                             var_init, pre_var_init, post_var_init,
                              pre_var_refs, post_var_refs),
             vars, pre_vars, post_vars)
 
@@ -996,21 +1175,22 @@ def init_toeplitz_connectivity(init_toeplitz_connect_snippet, params={}):
     init_toeplitz_connect_snippet = _get_snippet(init_toeplitz_connect_snippet,
                                                  InitToeplitzConnectivitySnippetBase,
                                                  init_toeplitz_connectivity_snippets)
-    return ToeplitzConnectivityInit(init_toeplitz_connect_snippet, 
-                                    _prepare_param_vals(params))
+    return ToeplitzConnectivityInit(
+        init_toeplitz_connect_snippet, 
+        _prepare_param_vals(params, init_toeplitz_connect_snippet))
 
-def _upgrade_code_string(code, class_name):
+@lru_cache(maxsize=1024)
+def _apply_code_upgrades(code):
     # Apply special-case upgrades
     upgraded = False
 
     for obj, replace in _code_upgrades:
         # If there's no supported replacement
         if replace is None:
-            # Search and give error if found
+            # Search and return unsupported call if found
             match = obj.search(code)
             if match is not None:
-                raise RuntimeError(f"'{match.group(0)}' call in "
-                                   f"'{class_name}' is no longer supported")
+                return None, False, match.group(0)
         # Otherwise
         else:
             # Replace pattern in code
@@ -1027,6 +1207,19 @@ def _upgrade_code_string(code, class_name):
     if n_subs > 0:
         upgraded = True
 
+    return code, upgraded, None
+
+def _upgrade_code_string(code, class_name):
+    # Upgrade code string
+    # **NOTE** regex work is cached by code string as the
+    # same code is often shared between many models
+    code, upgraded, unsupported = _apply_code_upgrades(code)
+
+    # If an unsupported call was found, give error
+    if unsupported is not None:
+        raise RuntimeError(f"'{unsupported}' call in "
+                           f"'{class_name}' is no longer supported")
+
     # If any upgrades were made, give warning
     if upgraded:
         warn(f"Legacy $() syntax in '{class_name}' has been automatically "
@@ -1034,13 +1227,75 @@ def _upgrade_code_string(code, class_name):
              f"please update your model", FutureWarning)
     return code
 
+def _freeze(value):
+    # Convert lists, tuples and dictionaries into (hashable) tuples and
+    # tag everything with its type so e.g. 1, 1.0 and True or a dictionary 
+    # and a list of its items don't produce the same key
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_freeze(v) for v in value))
+    elif isinstance(value, dict):
+        return (type(value), tuple((_freeze(k), _freeze(v))
+                                   for k, v in value.items()))
+    # Otherwise, check value is hashable (raising TypeError if not)
+    else:
+        hash(value)
+        return (type(value), value)
+
+def _cache_model(create_fn):
+    """Decorator for model creation functions which returns the previously
+    created model if a function is called again with identical arguments"""
+    @wraps(create_fn)
+    def wrapper(*args, **kwargs):
+        # Build cache key from arguments, falling
+        # back to creating model if any are unhashable
+        try:
+            key = (create_fn, _freeze(args), _freeze(kwargs))
+        except TypeError:
+            return create_fn(*args, **kwargs)
+
+        # If model isn't already cached, create and add to cache
+        model = _model_cache.get(key)
+        if model is None:
+            model = create_fn(*args, **kwargs)
+            _model_cache[key] = model
+        return model
+    return wrapper
+
+def _value_getter(value):
+    # Return getter method which returns value
+    # **NOTE** seperate function is required to ensure value is bound correctly
+    return lambda self: value
+
+@lru_cache(maxsize=1024)
+def _fast_dedent(code):
+    # If no lines are indented, skip regex scan performed by dedent
+    if (not code.startswith((" ", "\t")) and "\n " not in code
+            and "\n\t" not in code):
+        return code
+    else:
+        return dedent(code)
+
+def _code_getter(code, class_name):
+    # Upgrade and dedent code string once and return getter
+    return _value_getter(_fast_dedent(_upgrade_code_string(code, class_name)))
+
+def _add_code_getters(body, class_name, code_strings):
+    # Loop through code strings and add getters 
+    # to class body for any which are provided
+    for method_name, code in code_strings.items():
+        if code is not None:
+            body[method_name] = _code_getter(code, class_name)
+
 def _create_model(class_name: str, base, params, param_names, derived_params,
                   extra_global_params, custom_body):
     def ctor(self):
         base.__init__(self)
 
+    # **NOTE** models are immutable once created so
+    # instances don't need a __dict__ of their own
     body = {
         "__init__": ctor,
+        "__slots__": (),
     }
 
     if param_names is not None:
@@ -1050,8 +1305,8 @@ def _create_model(class_name: str, base, params, param_names, derived_params,
 
     if params is not None:
         body["get_params"] =\
-            lambda self: [Param(p) if isinstance(p, str) else Param(*p)
-                          for p in params]
+            _value_getter([Param(p) if isinstance(p, str) else Param(*p)
+                           for p in params])
 
     if derived_params is not None:
         # Helper to wrap lambda function so as to extract underlying value from NumericValue
@@ -1063,18 +1318,19 @@ def _create_model(class_name: str, base, params, param_names, derived_params,
                                                    dt))
 
         body["get_derived_params"] = \
-            lambda self: [DerivedParam(dp[0], wrap_lambda(dp[1]), *dp[2:])
-                          for dp in derived_params]
+            _value_getter([DerivedParam(dp[0], wrap_lambda(dp[1]), *dp[2:])
+                           for dp in derived_params])
 
     if extra_global_params is not None:
         body["get_extra_global_params"] = \
-            lambda self: [EGP(*egp) for egp in extra_global_params]
+            _value_getter([EGP(*egp) for egp in extra_global_params])
 
     if custom_body is not None:
         body.update(custom_body)
 
     return type(class_name, (base,), body)()
 
+@_cache_model
 def create_neuron_model(class_name: str, params: ModelParamsType = None,
                         param_names=None, vars: ModelVarsType = None,
                         var_name_types=None, 
@@ -1163,36 +1419,29 @@ def create_neuron_model(class_name: str, params: ModelParamsType = None,
              "and will be removed in future", FutureWarning)
         vars = var_name_types
 
-    if sim_code is not None:
-        body["get_sim_code"] =\
-            lambda self: dedent(_upgrade_code_string(sim_code, class_name))
-
-    if threshold_condition_code is not None:
-        body["get_threshold_condition_code"] = \
-            lambda self: dedent(_upgrade_code_string(threshold_condition_code,
-                                                    class_name))
-
-    if reset_code is not None:
-        body["get_reset_code"] = lambda self: dedent(_upgrade_code_string(reset_code,
-                                                                          class_name))
+    _add_code_getters(body, class_name, {
+        "get_sim_code": sim_code,
+        "get_threshold_condition_code": threshold_condition_code,
+        "get_reset_code": reset_code})
 
     if additional_input_vars:
         body["get_additional_input_vars"] = \
-            lambda self: [ParamVal(a[0], a[1], NumericValue(a[2]))
-                          for a in additional_input_vars]
+            _value_getter([ParamVal(a[0], a[1], NumericValue(a[2]))
+                           for a in additional_input_vars])
 
     if vars is not None:
         body["get_vars"] = \
-            lambda self: [Var(*vn) for vn in vars]
+            _value_getter([Var(*vn) for vn in vars])
 
     if auto_refractory_required is not None:
         body["is_auto_refractory_required"] = \
-            lambda self: auto_refractory_required
+            _value_getter(auto_refractory_required)
 
     return _create_model(class_name, NeuronModelBase, params, param_names,
                          derived_params, extra_global_params, body)
 
 
+@_cache_model
 def create_postsynaptic_model(class_name, params=None, param_names=None,
                               vars=None, var_name_types=None, 
                               neuron_var_refs: ModelVarRefsType = None,
@@ -1242,22 +1491,22 @@ def create_postsynaptic_model(class_name, params=None, param_names=None,
         vars = var_name_types
 
     if sim_code is not None:
-        body["get_sim_code"] =\
-            lambda self: dedent(_upgrade_code_string(sim_code, class_name))
+        body["get_sim_code"] = _code_getter(sim_code, class_name)
 
     if vars is not None:
         body["get_vars"] = \
-            lambda self: [Var(*vn) for vn in vars]
+            _value_getter([Var(*vn) for vn in vars])
     
     if neuron_var_refs is not None:
         body["get_neuron_var_refs"] =\
-            lambda self: [VarRef(*v) for v in neuron_var_refs]
+            _value_getter([VarRef(*v) for v in neuron_var_refs])
     
     return _create_model(class_name, PostsynapticModelBase, params,
                          param_names, derived_params,
                          extra_global_params, body)
 
 
+@_cache_model
 def create_weight_update_model(
         class_name: str, params: ModelParamsType = None, param_names=None,
         vars: ModelVarsType = None, var_name_types=None,
@@ -1510,86 +1759,45 @@ def create_weight_update_model(
              "and will be removed in future", FutureWarning)
         post_vars = post_var_name_types
         
-    if pre_spike_syn_code is not None:
-        body["get_pre_spike_syn_code"] =\
-            lambda self: dedent(_upgrade_code_string(pre_spike_syn_code,
-                                                     class_name))
-
-    if pre_event_syn_code is not None:
-        body["get_pre_event_syn_code"] =\
-            lambda self: dedent(_upgrade_code_string(pre_event_syn_code,
-                                                     class_name))
-
-    if post_event_syn_code is not None:
-        body["get_post_event_syn_code"] =\
-            lambda self: dedent(_upgrade_code_string(post_event_syn_code,
-                                                     class_name))
-
-    if post_spike_syn_code is not None:
-        body["get_post_spike_syn_code"] =\
-            lambda self: dedent(_upgrade_code_string(post_spike_syn_code,
-                                                     class_name))
-
-    if synapse_dynamics_code is not None:
-        body["get_synapse_dynamics_code"] =\
-            lambda self: dedent(_upgrade_code_string(synapse_dynamics_code,
-                                                     class_name))
-
-    if pre_event_threshold_condition_code is not None:
-        body["get_pre_event_threshold_condition_code"] = \
-            lambda self: dedent(_upgrade_code_string(pre_event_threshold_condition_code,
-                                                     class_name))
-    
-    if post_event_threshold_condition_code is not None:
-        body["get_post_event_threshold_condition_code"] = \
-            lambda self: dedent(_upgrade_code_string(post_event_threshold_condition_code,
-                                                     class_name))
-
-    if pre_spike_code is not None:
-        body["get_pre_spike_code"] =\
-            lambda self: dedent(_upgrade_code_string(pre_spike_code,
-                                                     class_name))
-
-    if post_spike_code is not None:
-        body["get_post_spike_code"] =\
-            lambda self: dedent(_upgrade_code_string(post_spike_code,
-                                                     class_name))
-
-    if pre_dynamics_code is not None:
-        body["get_pre_dynamics_code"] =\
-            lambda self: dedent(_upgrade_code_string(pre_dynamics_code,
-                                                     class_name))
-
-    if post_dynamics_code is not None:
-        body["get_post_dynamics_code"] =\
-            lambda self: dedent(_upgrade_code_string(post_dynamics_code,
-                                                     class_name))
+    _add_code_getters(body, class_name, {
+        "get_pre_spike_syn_code": pre_spike_syn_code,
+        "get_pre_event_syn_code": pre_event_syn_code,
+        "get_post_event_syn_code": post_event_syn_code,
+        "get_post_spike_syn_code": post_spike_syn_code,
+        "get_synapse_dynamics_code": synapse_dynamics_code,
+        "get_pre_event_threshold_condition_code": pre_event_threshold_condition_code,
+        "get_post_event_threshold_condition_code": post_event_threshold_condition_code,
+        "get_pre_spike_code": pre_spike_code,
+        "get_post_spike_code": post_spike_code,
+        "get_pre_dynamics_code": pre_dynamics_code,
+        "get_post_dynamics_code": post_dynamics_code})
     
     if vars is not None:
         body["get_vars"] = \
-            lambda self: [Var(*vn) for vn in vars]
+            _value_getter([Var(*vn) for vn in vars])
     
     if pre_vars is not None:
         body["get_pre_vars"] = \
-            lambda self: [Var(*vn) for vn in pre_vars]
+            _value_getter([Var(*vn) for vn in pre_vars])
 
     if post_vars is not None:
         body["get_post_vars"] = \
-            lambda self: [Var(*vn) for vn in post_vars]
+            _value_getter([Var(*vn) for vn in post_vars])
     
     if pre_neuron_var_refs is not None:
         body["get_pre_neuron_var_refs"] =\
-            lambda self: [VarRef(*v) for v in pre_neuron_var_refs]
+            _value_getter([VarRef(*v) for v in pre_neuron_var_refs])
 
     if post_neuron_var_refs is not None:
         body["get_post_neuron_var_refs"] =\
-            lambda self: [VarRef(*v) for v in post_neuron_var_refs]
+            _value_getter([VarRef(*v) for v in post_neuron_var_refs])
     
     return _create_model(class_name, WeightUpdateModelBase, params,
                          param_names, derived_params,
                          extra_global_params, body)
 
 
+@_cache_model
 def create_current_source_model(class_name: str, params: ModelParamsType = None,
                                 param_names=None, vars: ModelVarsType = None, var_name_types=None,
                                 neuron_var_refs: ModelVarRefsType = None, 
@@ -1643,23 +1851,22 @@ def create_current_source_model(class_name: str, params: ModelParamsType = None,
         vars = var_name_types
 
     if injection_code is not None:
-        body["get_injection_code"] =\
-            lambda self: dedent(_upgrade_code_string(injection_code,
-                                                     class_name))
+        body["get_injection_code"] = _code_getter(injection_code, class_name)
 
     if vars is not None:
         body["get_vars"] = \
-            lambda self: [Var(*vn) for vn in vars]
+            _value_getter([Var(*vn) for vn in vars])
     
     if neuron_var_refs is not None:
         body["get_neuron_var_refs"] =\
-            lambda self: [VarRef(*v) for v in var_refs]
+            _value_getter([VarRef(*v) for v in neuron_var_refs])
 
     return _create_model(class_name, CurrentSourceModelBase, params,
                          param_names, derived_params,
                          extra_global_params, body)
 
 
+@_cache_model
 def create_custom_update_model(class_name: str, params: ModelParamsType = None,
                                param_names=None, vars: CUModelVarsType = None, 
                                var_name_types=None, 
@@ -1770,24 +1977,24 @@ def create_custom_update_model(class_name: str, params: ModelParamsType = None,
         vars = var_name_types
 
     if update_code is not None:
-        body["get_update_code"] =\
-            lambda self: dedent(_upgrade_code_string(update_code, class_name))
+        body["get_update_code"] = _code_getter(update_code, class_name)
 
     if var_refs is not None:
-        body["get_var_refs"] = lambda self: [VarRef(*v) for v in var_refs]
+        body["get_var_refs"] = _value_getter([VarRef(*v) for v in var_refs])
 
     if vars is not None:
         body["get_vars"] = \
-            lambda self: [CustomUpdateVar(*vn) for vn in vars]
+            _value_getter([CustomUpdateVar(*vn) for vn in vars])
 
     if extra_global_param_refs is not None:
         body["get_extra_global_param_refs"] =\
-            lambda self: [EGPRef(*e) for e in extra_global_param_refs]
+            _value_getter([EGPRef(*e) for e in extra_global_param_refs])
 
     return _create_model(class_name, CustomUpdateModelBase, params,
                          param_names, derived_params,
                          extra_global_params, body)
 
+@_cache_model
 def create_custom_connectivity_update_model(class_name: str, 
                                             params: ModelParamsType = None,
                                             vars: ModelVarsType = None, 
@@ -1927,47 +2134,45 @@ def create_custom_connectivity_update_model(class_name: str,
     body = {}
 
     if row_update_code is not None:
-        body["get_row_update_code"] =\
-            lambda self: dedent(_upgrade_code_string(row_update_code,
-                                                     class_name))
+        body["get_row_update_code"] = _code_getter(row_update_code, class_name)
 
     if host_update_code is not None:
         body["get_host_update_code"] =\
-            lambda self: dedent(_upgrade_code_string(host_update_code,
-                                                     class_name))
+            _code_getter(host_update_code, class_name)
 
     if vars is not None:
         body["get_vars"] = \
-            lambda self: [Var(*vn) for vn in vars]
+            _value_getter([Var(*vn) for vn in vars])
 
     if pre_vars is not None:
         body["get_pre_vars"] = \
-            lambda self: [Var(*vn) for vn in pre_vars]
+            _value_getter([Var(*vn) for vn in pre_vars])
 
     if post_vars is not None:
         body["get_post_vars"] = \
-            lambda self: [Var(*vn) for vn in post_vars]
+            _value_getter([Var(*vn) for vn in post_vars])
 
     if var_refs is not None:
-        body["get_var_refs"] = lambda self: [VarRef(*v) for v in var_refs]
+        body["get_var_refs"] = _value_getter([VarRef(*v) for v in var_refs])
 
     if pre_var_refs is not None:
         body["get_pre_var_refs"] = \
-            lambda self: [VarRef(*v) for v in pre_var_refs]
+            _value_getter([VarRef(*v) for v in pre_var_refs])
 
     if post_var_refs is not None:
         body["get_post_var_refs"] = \
-            lambda self: [VarRef(*v) for v in post_var_refs]
+            _value_getter([VarRef(*v) for v in post_var_refs])
 
     if extra_global_param_refs is not None:
         body["get_extra_global_param_refs"] =\
-            lambda self: [EGPRef(*e) for e in extra_global_param_refs]
+            _value_getter([EGPRef(*e) for e in extra_global_param_refs])
 
     return _create_model(class_name, CustomConnectivityUpdateModelBase,
                          params, None, derived_params,
                          extra_global_params, body)
 
 
+@_cache_model
 def create_var_init_snippet(class_name: str, params: ModelParamsType = None,
                             param_names=None, 
                             derived_params: ModelDerivedParamsType = None,
@@ -2025,15 +2230,14 @@ def create_var_init_snippet(class_name: str, params: ModelParamsType = None,
     body = {}
 
     if var_init_code is not None:
-        body["get_code"] =\
-            lambda self: dedent(_upgrade_code_string(var_init_code,
-                                                     class_name))
+        body["get_code"] = _code_getter(var_init_code, class_name)
 
     return _create_model(class_name, InitVarSnippetBase,
                          params, param_names, derived_params,
                          extra_global_params, body)
 
 
+@_cache_model
 def create_sparse_connect_init_snippet(class_name: str, params=None, 
                                        param_names: ModelParamsType = None, 
                                        derived_params: ModelDerivedParamsType = None,
@@ -2114,31 +2318,28 @@ def create_sparse_connect_init_snippet(class_name: str, params=None,
     body = {}
 
     if row_build_code is not None:
-        body["get_row_build_code"] =\
-            lambda self: dedent(_upgrade_code_string(row_build_code,
-                                                     class_name))
+        body["get_row_build_code"] = _code_getter(row_build_code, class_name)
 
     if col_build_code is not None:
-        body["get_col_build_code"] =\
-            lambda self: dedent(_upgrade_code_string(col_build_code,
-                                                     class_name))
+        body["get_col_build_code"] = _code_getter(col_build_code, class_name)
 
     if calc_max_row_len_func is not None:
         body["get_calc_max_row_length_func"] = \
-            lambda self: _wrap_max_length_lambda(calc_max_row_len_func)
+            _value_getter(_wrap_max_length_lambda(calc_max_row_len_func))
 
     if calc_max_col_len_func is not None:
         body["get_calc_max_col_length_func"] = \
-            lambda self: _wrap_max_length_lambda(calc_max_col_len_func)
+            _value_getter(_wrap_max_length_lambda(calc_max_col_len_func))
 
     if calc_kernel_size_func is not None:
         body["get_calc_kernel_size_func"] = \
-            lambda self: _wrap_kernel_size_lambda(calc_kernel_size_func)
+            _value_getter(_wrap_kernel_size_lambda(calc_kernel_size_func))
 
     return _create_model(class_name, InitSparseConnectivitySnippetBase, params,
                          param_names, derived_params,
                          extra_global_params, body)
 
+@_cache_model
 def create_toeplitz_connect_init_snippet(class_name: str, params: ModelParamsType=None,
                                          param_names=None,
                                          derived_params: ModelDerivedParamsType = None,
@@ -2212,16 +2413,15 @@ def create_toeplitz_connect_init_snippet(class_name: str, params: ModelParamsTyp
 
     if diagonal_build_code is not None:
         body["get_diagonal_build_code"] =\
-            lambda self: dedent(_upgrade_code_string(diagonal_build_code,
-                                                     class_name))
+            _code_getter(diagonal_build_code, class_name)
 
     if calc_max_row_len_func is not None:
         body["get_calc_max_row_length_func"] = \
-            lambda self: _wrap_max_length_lambda(calc_max_row_len_func)
+            _value_getter(_wrap_max_length_lambda(calc_max_row_len_func))
 
     if calc_kernel_size_func is not None:
         body["get_calc_kernel_size_func"] = \
-            lambda self: _wrap_kernel_size_lambda(calc_kernel_size_func)
+            _value_getter(_wrap_kernel_size_lambda(calc_kernel_size_func))
 
     return _create_model(class_name, InitToeplitzConnectivitySnippetBase,
                          params, param_names, derived_params,
@@ -8,6 +8,7 @@ from ._genn import (NumericValue, ResolvedType, SynapseMatrixConnectivity,
 from .init_var_snippets import Uninitialised
 
 from copy import copy
+from functools import lru_cache
 from weakref import proxy, ref
 from ._deprecated import deprecated
 
@@ -43,10 +44,10 @@ class ArrayBase:
         model = self.group._model
         resolved_type = (self.type if isinstance(self.type, ResolvedType)
                          else self.type.resolve(model._type_context))
-        dtype = model.genn_types[resolved_type]
+        dtype = np.dtype(model.genn_types[resolved_type])
         
-        # Get dtype view of host memoryview
-        self._view = np.asarray(array.host_view).view(dtype)
+        # Get numpy array directly over host memory
+        self._view = array.host_array(dtype)
         assert not self._view.flags["OWNDATA"]
 
         # Reshape view if shape is provided
@@ -335,8 +336,20 @@ class ExtraGlobalParameter(Array):
     def values(self, vals: np.ndarray):
         self._view[:] = vals
 
-def _prepare_param_vals(params):
-    return {n: NumericValue(v) for n, v in params.items()}
+def _prepare_param_vals(params, snippet):
+    # If parameters are provided as an array, 
+    # they are ordered in the same way as the snippet's
+    if isinstance(params, np.ndarray):
+        param_names = [p.name for p in snippet.get_params()]
+        if params.shape != (len(param_names),):
+            raise ValueError(f"Parameter array must have shape "
+                             f"({len(param_names)},)")
+
+        # **NOTE** tolist converts all values to Python scalars in one call
+        return {n: NumericValue(v)
+                for n, v in zip(param_names, params.tolist())}
+    else:
+        return {n: NumericValue(v) for n, v in params.items()}
 
 def _prepare_vars(vars, var_space, group, var_type=Variable):
     return {v.name: var_type(v.name, v.type, var_space[v.name], group)
@@ -375,6 +388,13 @@ def _get_var_init(var_space):
     return var_init
             
     
+@lru_cache(maxsize=None)
+def _get_built_in_snippet(built_in_snippet_module, name):
+    # Get function with this name from module and call it
+    # **NOTE** built in snippets are singletons so the
+    # result can be cached rather than crossing into C++ again
+    return getattr(built_in_snippet_module, name)()
+
 def _get_snippet(snippet, snippet_base_class, built_in_snippet_module):
     """Check whether the model is valid, i.e is native or derived
     from model_family.Custom
@@ -394,10 +414,9 @@ def _get_snippet(snippet, snippet_base_class, built_in_snippet_module):
                        from snippet_base_class is provided
     """
     
-    # If model is a string, get function with 
-    # this name from module and call it
+    # If model is a string, get built in snippet with this name
     if isinstance(snippet, str):
-        return getattr(built_in_snippet_module, snippet)()
+        return _get_built_in_snippet(built_in_snippet_module, snippet)
     # Otherwise, if model is derived off correct 
     # base class, return it directly
     elif isinstance(snippet, snippet_base_class):
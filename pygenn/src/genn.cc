@@ -1,3 +1,8 @@
+// Standard C++ includes
+#include <fstream>
+#include <iterator>
+#include <sstream>
+
 // PyBind11 includes
 #include <pybind11/functional.h>
 #include <pybind11/pybind11.h>
@@ -223,6 +228,23 @@ public:
     virtual std::vector<Models::Base::VarRef> getPostNeuronVarRefs() const override { PYBIND11_OVERRIDE_NAME(std::vector<Models::Base::VarRef> , Base, "get_post_neuron_var_refs", getPostNeuronVarRefs); }
 };
 
+void writeIfChanged(const filesystem::path &path, const std::string &contents)
+{
+    // If file already exists with identical contents, leave it alone so its
+    // modification time doesn't cause the runner library to be rebuilt
+    {
+        std::ifstream existing(path.str(), std::ios::binary);
+        if(existing.good()
+           && std::string(std::istreambuf_iterator<char>(existing), std::istreambuf_iterator<char>()) == contents)
+        {
+            return;
+        }
+    }
+
+    std::ofstream file(path.str(), std::ios::binary);
+    file << contents;
+}
+
 const CodeGenerator::ModelSpecMerged *generateCode(ModelSpecInternal &model, CodeGenerator::BackendBase &backend, 
                                                    const std::string &sharePathStr, const std::string &outputPathStr,
                                                    bool forceRebuild, bool neverRebuild)
@@ -238,12 +260,14 @@ const CodeGenerator::ModelSpecMerged *generateCode(ModelSpecInternal &model, Cod
 
 #ifdef _WIN32
     // Create MSBuild project to compile and link all generated modules
-    std::ofstream makefile((outputPath / "runner.vcxproj").str());
+    std::ostringstream makefile;
     CodeGenerator::generateMSBuild(makefile, model, backend, "", output);
+    writeIfChanged(outputPath / "runner.vcxproj", makefile.str());
 #else
     // Create makefile to compile and link all generated modules
-    std::ofstream makefile((outputPath / "Makefile").str());
+    std::ostringstream makefile;
     CodeGenerator::generateMakefile(makefile, backend, output);
+    writeIfChanged(outputPath / "Makefile", makefile.str());
 #endif
     return modelMerged;
 }
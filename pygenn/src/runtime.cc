@@ -1,3 +1,7 @@
+// Standard C++ includes
+#include <cstring>
+#include <stdexcept>
+
 // PyBind11 includes
 #include <pybind11/pybind11.h>
 #include <pybind11/numpy.h>
@@ -23,6 +27,31 @@ using namespace pybind11::literals;
 //----------------------------------------------------------------------------
 PYBIND11_MODULE(_runtime, m) 
 {
+    //------------------------------------------------------------------------
+    // Free functions
+    //------------------------------------------------------------------------
+    // Batched transfers so lists of arrays only cross the Python boundary once
+    m.def("push_arrays_to_device", 
+          [](const std::vector<ArrayBase*> &arrays)
+          {
+              for(auto *a : arrays) {
+                  if(a == nullptr) {
+                      throw std::invalid_argument("Array has not been allocated");
+                  }
+                  a->pushToDevice();
+              }
+          });
+    m.def("pull_arrays_from_device", 
+          [](const std::vector<ArrayBase*> &arrays)
+          {
+              for(auto *a : arrays) {
+                  if(a == nullptr) {
+                      throw std::invalid_argument("Array has not been allocated");
+                  }
+                  a->pullFromDevice();
+              }
+          });
+
     //------------------------------------------------------------------------
     // runtime.ArrayBase
     //------------------------------------------------------------------------
@@ -40,6 +69,19 @@ PYBIND11_MODULE(_runtime, m)
         //--------------------------------------------------------------------
         // Methods
         //--------------------------------------------------------------------
+        .def("host_array",
+            [](pybind11::object self, const pybind11::dtype &dtype)
+            {
+                // Create numpy array directly over host memory, using
+                // ArrayBase object as base so no copy is made
+                const auto &a = self.cast<const ArrayBase&>();
+                if(a.getHostPointer() == nullptr) {
+                    throw std::runtime_error("Array has no host memory");
+                }
+                const pybind11::ssize_t count = static_cast<pybind11::ssize_t>(a.getSizeBytes()) / dtype.itemsize();
+                return pybind11::array(dtype, {count}, {dtype.itemsize()},
+                                       a.getHostPointer(), self);
+            })
         .def("push_to_device", &ArrayBase::pushToDevice)
         .def("pull_from_device", &ArrayBase::pullFromDevice)
         .def("push_slice_1d_to_device", &ArrayBase::pushSlice1DToDevice)
@@ -78,6 +120,51 @@ PYBIND11_MODULE(_runtime, m)
         .def("initialize", &Runtime::initialize)
         .def("initialize_sparse", &Runtime::initializeSparse)
         .def("step_time", &Runtime::stepTime)
+        .def("reset_delay_pointers", &Runtime::resetDelayPointers)
+        .def("run",
+             [](Runtime &r, unsigned int numSteps, const std::vector<ArrayBase*> &arrays,
+                std::vector<pybind11::array> &destinations)
+             {
+                 // How many timesteps to simulate between checking for signals
+                 constexpr unsigned int signalCheckInterval = 1000;
+
+                 if(arrays.size() != destinations.size()) {
+                     throw std::invalid_argument("Each recorded array requires a destination");
+                 }
+
+                 // Check destinations are contiguous and large enough to hold every timestep
+                 std::vector<std::byte*> destinationPointers;
+                 destinationPointers.reserve(destinations.size());
+                 for(size_t i = 0; i < arrays.size(); i++) {
+                     if(arrays[i] == nullptr) {
+                         throw std::invalid_argument("Array has not been allocated");
+                     }
+                     auto &d = destinations[i];
+                     if(!(d.flags() & pybind11::array::c_style)) {
+                         throw std::invalid_argument("Recording destinations must be C-contiguous");
+                     }
+                     if(static_cast<size_t>(d.nbytes()) < (numSteps * arrays[i]->getSizeBytes())) {
+                         throw std::invalid_argument("Recording destination is too small");
+                     }
+                     destinationPointers.push_back(reinterpret_cast<std::byte*>(d.mutable_data()));
+                 }
+
+                 // Simulate, copying arrays into destinations after each timestep
+                 for(unsigned int t = 0; t < numSteps; t++) {
+                     r.stepTime();
+                     for(size_t i = 0; i < arrays.size(); i++) {
+                         const size_t sizeBytes = arrays[i]->getSizeBytes();
+                         arrays[i]->pullFromDevice();
+                         std::memcpy(destinationPointers[i] + (t * sizeBytes),
+                                     arrays[i]->getHostPointer(), sizeBytes);
+                     }
+
+                     // Periodically handle signals so long runs can be interrupted with Ctrl-C
+                     if((t % signalCheckInterval) == (signalCheckInterval - 1) && PyErr_CheckSignals() != 0) {
+                         throw pybind11::error_already_set();
+                     }
+                 }
+             })
         .def("custom_update", &Runtime::customUpdate)
 
         .def("get_delay_pointer", &Runtime::getDelayPointer)
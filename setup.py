@@ -44,10 +44,7 @@ hip_installed = hip_path is not None and os.path.exists(hip_path)
 LINUX = system() == "Linux"
 
 # Are we on WSL?
-if sys.version_info < (3, 3):
-    WSL = "microsoft" in uname()[2]
-else:
-    WSL = "microsoft" in uname().release
+WSL = "microsoft" in uname().release
 
 # Determine correct suffix for GeNN libraries
 if WIN:
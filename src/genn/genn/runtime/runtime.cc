@@ -698,6 +698,14 @@ void Runtime::stepTime()
     m_Timestep++;
 }
 //----------------------------------------------------------------------------
+void Runtime::resetDelayPointers()
+{
+    // Reset delay queue pointers to match those zeroed by initialisation
+    for(auto &d : m_DelayQueuePointer) {
+        d.second = 0;
+    }
+}
+//----------------------------------------------------------------------------
 void Runtime::customUpdate(const std::string &name)
 {
     // If there are column length arrays that must be zeroed 
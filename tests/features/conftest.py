@@ -4,6 +4,21 @@ from pygenn import GeNNModel
 
 from pygenn.genn_model import backend_modules
 
+def _get_importable_backends():
+    # Backends are only probed when listed so skip
+    # any which are installed but can't be imported
+    backends = []
+    for b in backend_modules.keys():
+        try:
+            backend_modules[b]
+        except ImportError:
+            pass
+        else:
+            backends.append(b)
+    return backends
+
+importable_backends = _get_importable_backends()
+
 @pytest.fixture
 def make_model():
     created_models = []
@@ -37,12 +52,12 @@ def pytest_generate_tests(metafunc):
     if backend_simt_param:
         assert not batch_size_param
         metafunc.parametrize("backend_simt", 
-                             [b for b in backend_modules.keys() if b != "single_threaded_cpu"],
+                             [b for b in importable_backends if b != "single_threaded_cpu"],
                              indirect=True)
                              
     if backend_param and batch_size_param:
         params = []
-        for b in backend_modules.keys():
+        for b in importable_backends:
             params.append((b, 1))
             
             if b != "single_threaded_cpu":
@@ -50,4 +65,4 @@ def pytest_generate_tests(metafunc):
     
         metafunc.parametrize("backend, batch_size", params, indirect=True)
     elif backend_param:
-        metafunc.parametrize("backend", backend_modules.keys(), indirect=True)
+        metafunc.parametrize("backend", importable_backends, indirect=True)
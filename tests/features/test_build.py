@@ -0,0 +1,41 @@
+import pytest
+from pygenn import types
+
+from pygenn import create_neuron_model, GeNNModel
+from platform import system
+
+import pygenn.genn_model
+
+def _build_model(backend, **kwargs):
+    neuron_model = create_neuron_model(
+        "neuron",
+        sim_code=
+        """
+        x += 1.0;
+        """,
+        vars=[("x", "scalar")])
+
+    model = GeNNModel(types.Float, "test_build", backend=backend)
+    model.dt = 1.0
+    model.add_neuron_population("Neurons", 10, neuron_model,
+                                {}, {"x": 0.0})
+    model.build(**kwargs)
+
+@pytest.mark.skipif(system() == "Windows",
+                    reason="MSBuild performs its own dependency checking")
+def test_build_up_to_date(backend, monkeypatch):
+    # Build model from scratch
+    _build_model(backend, always_rebuild=True)
+
+    # Record any calls to make
+    calls = []
+    monkeypatch.setattr(pygenn.genn_model, "check_call",
+                        lambda *args, **kwargs: calls.append(args))
+
+    # Check rebuilding identical model doesn't invoke make
+    _build_model(backend)
+    assert len(calls) == 0
+
+    # Check forcing rebuild does
+    _build_model(backend, always_rebuild=True)
+    assert len(calls) == 1
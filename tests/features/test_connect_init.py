@@ -13,7 +13,7 @@ empty_neuron_model = create_neuron_model("empty")
 @pytest.mark.parametrize("precision", [types.Double, types.Float])
 def test_connect_init(make_model, backend, precision):
     model = make_model(precision, "test_connect_init", backend=backend)
-    model.narrow_sparse_ind_enabled = True
+    model.default_narrow_sparse_ind_enabled = True
     
     # Create pre and postsynaptic neuron populations
     pre_pop = model.add_neuron_population("Pre", 100, empty_neuron_model)
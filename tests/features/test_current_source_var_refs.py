@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+from pygenn import types
+
+from pygenn import VarAccessMode
+from pygenn import (create_current_source_model, create_neuron_model,
+                    create_var_ref)
+
+@pytest.mark.parametrize("precision", [types.Double, types.Float])
+def test_current_source_var_refs(make_model, backend, precision):
+    neuron_model = create_neuron_model(
+        "neuron",
+        sim_code=
+        """
+        x = Isyn;
+        """,
+        vars=[("x", "scalar"), ("shift", "scalar"), ("count", "scalar")])
+
+    # Current source model which injects one neuron variable
+    # as current and increments another every timestep
+    current_source_model = create_current_source_model(
+        "current_source",
+        injection_code=
+        """
+        c += 1.0;
+        injectCurrent(s);
+        """,
+        neuron_var_refs=[("s", "scalar", VarAccessMode.READ_ONLY),
+                         ("c", "scalar")])
+
+    model = make_model(precision, "test_current_source_var_refs",
+                       backend=backend)
+    model.dt = 1.0
+
+    shift = np.arange(0.0, 100.0, 10.0)
+    n_pop = model.add_neuron_population("Neurons", 10, neuron_model, {},
+                                        {"x": 0.0, "shift": shift,
+                                         "count": 0.0})
+    model.add_current_source("CurrentSource", current_source_model, n_pop,
+                             {}, {}, {"s": create_var_ref(n_pop, "shift"),
+                                      "c": create_var_ref(n_pop, "count")})
+
+    # Build model and load
+    model.build()
+    model.load()
+
+    # Simulate, checking values after every timestep
+    x = n_pop.vars["x"]
+    count = n_pop.vars["count"]
+    while model.timestep < 10:
+        model.step_time()
+        model.pull_from_device([x, count])
+
+        assert np.allclose(x.values, shift)
+        assert np.allclose(count.values, model.timestep)
@@ -0,0 +1,39 @@
+from pygenn import create_neuron_model, create_var_init_snippet
+
+def _create_neuron(**kwargs):
+    args = {"params": ["a"],
+            "vars": [("x", "scalar")],
+            "sim_code": "x = a;",
+            "additional_input_vars": [("i", "scalar", 1.0)]}
+    args.update(kwargs)
+    return create_neuron_model("neuron", **args)
+
+def test_model_cache():
+    # Check identical calls return the same model
+    neuron = _create_neuron()
+    assert _create_neuron() is neuron
+
+    init = create_var_init_snippet("init", params=["a"],
+                                   var_init_code="value = a;")
+    assert create_var_init_snippet("init", params=["a"],
+                                   var_init_code="value = a;") is init
+
+    # Check calls differing in any argument return different models
+    assert _create_neuron(params=["b"]) is not neuron
+    assert _create_neuron(vars=[("x", "int")]) is not neuron
+    assert _create_neuron(sim_code="x = a + 1;") is not neuron
+    assert _create_neuron(threshold_condition_code="x > a") is not neuron
+    assert _create_neuron(additional_input_vars=[("j", "scalar", 1.0)]) is not neuron
+    assert create_neuron_model("other_neuron", params=["a"],
+                               vars=[("x", "scalar")], sim_code="x = a;",
+                               additional_input_vars=[("i", "scalar", 1.0)]) is not neuron
+
+    # Check calls differing only in the type of an argument return different models
+    int_neuron = _create_neuron(additional_input_vars=[("i", "scalar", 1)])
+    bool_neuron = _create_neuron(additional_input_vars=[("i", "scalar", True)])
+    assert int_neuron is not neuron
+    assert bool_neuron is not neuron
+    assert bool_neuron is not int_neuron
+    assert _create_neuron(params=("a",)) is not neuron
+    assert _create_neuron(vars=[["x", "scalar"]]) is not neuron
+
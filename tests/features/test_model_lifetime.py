@@ -0,0 +1,38 @@
+import numpy as np
+from pygenn import types
+
+from pygenn import create_neuron_model, GeNNModel
+from weakref import ref
+
+def _build_load_model(backend, increment):
+    neuron_model = create_neuron_model(
+        "neuron",
+        sim_code=f"x += {increment};",
+        vars=[("x", "scalar")])
+
+    model = GeNNModel(types.Float, "test_model_lifetime", backend=backend)
+    model.dt = 1.0
+    n_pop = model.add_neuron_population("Neurons", 10, neuron_model,
+                                        {}, {"x": 0.0})
+
+    # Build model and load
+    model.build()
+    model.load()
+    return model, n_pop
+
+def test_model_lifetime(backend):
+    # Build and load a model and drop it without unloading
+    model, n_pop = _build_load_model(backend, 1.0)
+    model_ref = ref(model)
+    del model, n_pop
+
+    # Check groups don't keep model (and thus runtime) alive
+    assert model_ref() is None
+
+    # Rebuild model with same name but different code and check
+    # that the new runner library is the one which gets loaded
+    model, n_pop = _build_load_model(backend, 100.0)
+    model.step_time()
+    n_pop.vars["x"].pull_from_device()
+    assert np.allclose(n_pop.vars["x"].values, 100.0)
+    model.unload()
@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+from pygenn import types
+
+from pygenn import create_neuron_model, init_var
+
+@pytest.mark.parametrize("precision", [types.Double, types.Float])
+def test_param_array(make_model, backend, precision):
+    neuron_model = create_neuron_model(
+        "neuron",
+        sim_code=
+        """
+        x = a + (b * t);
+        """,
+        params=["a", "b"],
+        vars=[("x", "scalar"), ("y", "scalar")])
+
+    model = make_model(precision, "test_param_array", backend=backend)
+    model.dt = 1.0
+
+    # Provide parameters as arrays ordered like the model's params
+    n_pop = model.add_neuron_population(
+        "Neurons", 10, neuron_model, np.array([3.0, 2.0]),
+        {"x": 0.0, "y": init_var("Constant", np.array([5.0]))})
+
+    # Check arrays with the wrong number of parameters are rejected
+    with pytest.raises(ValueError):
+        model.add_neuron_population("BadNeurons", 10, neuron_model,
+                                    np.array([3.0, 2.0, 1.0]),
+                                    {"x": 0.0, "y": 0.0})
+
+    # Build model and load
+    model.build()
+    model.load()
+
+    # Simulate, checking values after every timestep
+    x = n_pop.vars["x"]
+    y = n_pop.vars["y"]
+    while model.timestep < 10:
+        model.step_time()
+        model.pull_from_device([x, y])
+
+        assert np.allclose(x.values, 3.0 + (2.0 * (model.timestep - 1)))
+        assert np.allclose(y.values, 5.0)
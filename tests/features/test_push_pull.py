@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+from pygenn import types
+
+from pygenn import create_neuron_model, VarLocation
+
+@pytest.mark.parametrize("precision", [types.Double, types.Float])
+def test_push_pull(make_model, backend, precision):
+    neuron_model = create_neuron_model(
+        "neuron",
+        sim_code=
+        """
+        x += 1.0;
+        y += 2.0;
+        z += 3.0;
+        """,
+        vars=[("x", "scalar"), ("y", "scalar"), ("z", "scalar")])
+
+    model = make_model(precision, "test_push_pull", backend=backend)
+    model.dt = 1.0
+
+    n_pop = model.add_neuron_population("Neurons", 10, neuron_model,
+                                        {}, {"x": 0.0, "y": 0.0, "z": 0.0})
+    n_pop.set_var_location("z", VarLocation.DEVICE)
+
+    # Build model and load
+    model.build()
+    model.load()
+
+    # Overwrite x and y on host and push both in one call
+    x = n_pop.vars["x"]
+    y = n_pop.vars["y"]
+    x.view[:] = np.arange(10.0)
+    y.view[:] = np.arange(10.0, 20.0)
+    model.push_to_device([x, y])
+
+    # Simulate and pull both back in one call
+    model.step_time()
+    model.pull_from_device([x, y])
+    assert np.allclose(x.view, np.arange(10.0) + 1.0)
+    assert np.allclose(y.view, np.arange(10.0, 20.0) + 2.0)
+
+    # Check device-only variables are rejected rather than
+    # being passed through to the runtime as null arrays
+    z = n_pop.vars["z"]
+    with pytest.raises(ValueError):
+        model.push_to_device([x, z])
+    with pytest.raises(ValueError):
+        model.pull_from_device([z, y])
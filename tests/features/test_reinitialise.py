@@ -0,0 +1,170 @@
+import numpy as np
+import pytest
+from pygenn import types
+
+from pygenn import VarAccessMode
+from pygenn import (create_neuron_model, create_var_ref,
+                    create_weight_update_model, init_postsynaptic,
+                    init_sparse_connectivity, init_var,
+                    init_weight_update)
+
+@pytest.mark.parametrize("precision", [types.Double, types.Float])
+def test_reinitialise(make_model, backend, precision):
+    neuron_model = create_neuron_model(
+        "neuron",
+        sim_code=
+        """
+        x += 1.0;
+        shift += 1.0;
+        """,
+        vars=[("x", "scalar"), ("shift", "scalar")])
+
+    model = make_model(precision, "test_reinitialise", backend=backend)
+    model.dt = 1.0
+
+    shift = np.arange(0.0, 100.0, 10.0)
+    n_pop = model.add_neuron_population("Neurons", 10, neuron_model,
+                                        {}, {"x": 0.0, "shift": shift})
+
+    # Build model and load
+    model.build()
+    model.load()
+
+    # Simulate, recording x and shift after every timestep
+    x = np.empty((10, 10), dtype=n_pop.vars["x"].view.dtype)
+    shift_rec = np.empty((10, 10), dtype=n_pop.vars["shift"].view.dtype)
+    model.run(10, {n_pop.vars["x"]: x, n_pop.vars["shift"]: shift_rec})
+    assert model.timestep == 10
+
+    for t in range(10):
+        assert np.allclose(x[t], t + 1.0)
+        assert np.allclose(shift_rec[t], shift + t + 1.0)
+
+    # Reinitialise model
+    model.reinitialise()
+    assert model.timestep == 0
+
+    # Check both device and host-initialised variables are reset
+    model.pull_from_device([n_pop.vars["x"], n_pop.vars["shift"]])
+    assert np.allclose(n_pop.vars["x"].values, 0.0)
+    assert np.allclose(n_pop.vars["shift"].values, shift)
+
+@pytest.mark.parametrize("precision", [types.Double, types.Float])
+def test_reinitialise_delay_sparse(make_model, backend, precision):
+    time_neuron_model = create_neuron_model(
+        "time_neuron",
+        sim_code=
+        """
+        x = t;
+        """,
+        vars=[("x", "scalar")])
+
+    empty_neuron_model = create_neuron_model("empty_neuron")
+
+    # Weight update model which copies delayed presynaptic variable into synapse
+    pre_weight_update_model = create_weight_update_model(
+        "pre_weight_update",
+        vars=[("w", "scalar")],
+        pre_neuron_var_refs=[("x", "scalar", VarAccessMode.READ_ONLY)],
+        synapse_dynamics_code=
+        """
+        w = x;
+        """)
+
+    model = make_model(precision, "test_reinitialise_delay_sparse",
+                       backend=backend)
+    model.dt = 1.0
+
+    pre_n_pop = model.add_neuron_population("PreNeurons", 10,
+                                            time_neuron_model,
+                                            {}, {"x": -1.0})
+    post_n_pop = model.add_neuron_population("PostNeurons", 10,
+                                             empty_neuron_model)
+
+    # Add sparse synapse population with manually-set connectivity
+    # and an axonal delay so presynaptic variable is delayed
+    s_pop = model.add_synapse_population(
+        "Synapses", "SPARSE", pre_n_pop, post_n_pop,
+        init_weight_update(pre_weight_update_model, {}, {"w": 0.0},
+                           pre_var_refs={"x": create_var_ref(pre_n_pop, "x")}),
+        init_postsynaptic("DeltaCurr"))
+    s_pop.set_sparse_connections(np.arange(10), (np.arange(10) + 1) % 10)
+    s_pop.axonal_delay_steps = 5
+
+    # Build model and load
+    model.build()
+    model.load()
+
+    # Simulate a number of timesteps which isn't a
+    # multiple of the number of delay slots
+    model.run(10)
+    model.pull_from_device([pre_n_pop.vars["x"], s_pop.vars["w"]])
+    assert np.allclose(pre_n_pop.vars["x"].current_values, 9.0)
+    first_w = s_pop.vars["w"].values
+    assert not np.allclose(first_w, 0.0)
+
+    # Reinitialise model and check state is reset
+    model.reinitialise()
+    assert model.timestep == 0
+    model.pull_from_device([pre_n_pop.vars["x"], s_pop.vars["w"]])
+    assert np.allclose(pre_n_pop.vars["x"].values, -1.0)
+    assert np.allclose(s_pop.vars["w"].values, 0.0)
+
+    # Simulate again and check delayed variables are read from
+    # the correct slot and sparse connectivity is still in place
+    model.run(10)
+    model.pull_from_device([pre_n_pop.vars["x"], s_pop.vars["w"]])
+    assert np.allclose(pre_n_pop.vars["x"].current_values, 9.0)
+    assert np.allclose(s_pop.vars["w"].values, first_w)
+
+@pytest.mark.parametrize("precision", [types.Double, types.Float])
+def test_reinitialise_random(make_model, backend, precision):
+    neuron_model = create_neuron_model(
+        "neuron",
+        vars=[("x", "scalar")])
+
+    model = make_model(precision, "test_reinitialise_random",
+                       backend=backend)
+    model.dt = 1.0
+
+    # Add population with randomly initialised variable
+    n_pop = model.add_neuron_population(
+        "Neurons", 100, neuron_model, {},
+        {"x": init_var("Uniform", {"min": 0.0, "max": 1.0})})
+
+    # Add synapse population with random sparse connectivity
+    s_pop = model.add_synapse_population(
+        "Synapses", "SPARSE", n_pop, n_pop,
+        init_weight_update("StaticPulseConstantWeight", {"g": 1.0}),
+        init_postsynaptic("DeltaCurr"),
+        init_sparse_connectivity("FixedProbability", {"prob": 0.1}))
+
+    # Build model and load
+    model.build()
+    model.load()
+
+    # Read initial random state
+    n_pop.vars["x"].pull_from_device()
+    s_pop.pull_connectivity_from_device()
+    first_x = n_pop.vars["x"].values
+    first_pre_inds = s_pop.get_sparse_pre_inds()
+    first_post_inds = s_pop.get_sparse_post_inds()
+
+    # Reinitialise model and read state again
+    model.reinitialise()
+    n_pop.vars["x"].pull_from_device()
+    s_pop.pull_connectivity_from_device()
+    x = n_pop.vars["x"].values
+    pre_inds = s_pop.get_sparse_pre_inds()
+    post_inds = s_pop.get_sparse_post_inds()
+
+    # Check random state is drawn again from the same distributions
+    assert np.all((x >= 0.0) & (x <= 1.0))
+    assert np.all((post_inds >= 0) & (post_inds < 100))
+    assert len(pre_inds) == len(post_inds)
+
+    # Check that, with the default seed, it has been redrawn
+    # rather than restored to the values drawn when loading
+    assert not np.allclose(x, first_x)
+    assert not (np.array_equal(pre_inds, first_pre_inds)
+                and np.array_equal(post_inds, first_post_inds))
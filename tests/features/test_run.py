@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+from pygenn import types
+
+from pygenn import create_neuron_model, VarLocation
+
+@pytest.mark.parametrize("precision", [types.Double, types.Float])
+def test_run(make_model, backend, precision):
+    neuron_model = create_neuron_model(
+        "neuron",
+        sim_code=
+        """
+        x += 1.0;
+        shift += 1.0;
+        y += 1.0;
+        """,
+        vars=[("x", "scalar"), ("shift", "scalar"), ("y", "scalar")])
+
+    model = make_model(precision, "test_run", backend=backend)
+    model.dt = 1.0
+
+    shift = np.arange(0.0, 100.0, 10.0)
+    n_pop = model.add_neuron_population("Neurons", 10, neuron_model,
+                                        {}, {"x": 0.0, "shift": shift,
+                                             "y": 0.0})
+    n_pop.set_var_location("y", VarLocation.DEVICE)
+
+    # Build model and load
+    model.build()
+    model.load()
+
+    # Simulate without recording
+    model.run(5)
+    assert model.timestep == 5
+
+    # Simulate, recording x and shift after every timestep
+    x = np.empty((10, 10), dtype=n_pop.vars["x"].view.dtype)
+    shift_rec = np.empty((10, 10), dtype=n_pop.vars["shift"].view.dtype)
+    model.run(10, {n_pop.vars["x"]: x, n_pop.vars["shift"]: shift_rec})
+    assert model.timestep == 15
+
+    for t in range(10):
+        assert np.allclose(x[t], t + 6.0)
+        assert np.allclose(shift_rec[t], shift + t + 6.0)
+
+    # Check destinations with the wrong dtype are rejected
+    with pytest.raises(ValueError):
+        model.run(1, {n_pop.vars["x"]: np.empty((1, 10), dtype=np.int32)})
+
+    # Check device-only variables can't be recorded
+    with pytest.raises(ValueError):
+        model.run(1, {n_pop.vars["y"]: np.empty((1, 10), dtype=x.dtype)})
+
+    # Check destinations too small to hold every timestep are rejected
+    with pytest.raises(ValueError):
+        model.run(2, {n_pop.vars["x"]: np.empty((1, 10), dtype=x.dtype)})
+
+    # Check non-contiguous destinations are rejected
+    with pytest.raises(ValueError):
+        model.run(1, {n_pop.vars["x"]: np.empty((1, 20), dtype=x.dtype)[:, ::2]})
+
+    # Check model hasn't been advanced by rejected calls
+    assert model.timestep == 15